@@ -2,6 +2,32 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
+
+from src.monitoring.collectors import SystemMetrics
+
+
+@pytest.fixture
+def make_data():
+    """Build collected monitoring data with real SystemMetrics."""
+
+    def build(timestamp, cpu_percent=50.0, memory_percent=60.0):
+        return {
+            "system_metrics": SystemMetrics(
+                timestamp=timestamp,
+                cpu_percent=cpu_percent,
+                memory_percent=memory_percent,
+                disk_usage={"/": {"percent": 40.0}},
+                network_io={},
+                process_count=10,
+                load_average=[0.0, 0.0, 0.0],
+            ),
+            "top_processes": [],
+            "timestamp": timestamp,
+        }
+
+    return build
@@ -2,24 +2,48 @@
 """Development helper script."""
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Read-only checks, safe to run at the same time once formatting is done
+CHECK_JOBS = [
+    (["flake8", "src", "tests", "--max-line-length=88"], "Linting"),
+    (["pytest", "tests/", "-v"], "Running tests"),
+]
+
 
 def run_command(command, description):
     """Run a command and handle errors."""
     print(f"\n🔄 {description}...")
     try:
-        result = subprocess.run(
-            command, shell=True, check=True, capture_output=True, text=True
+        # Single pipe for both streams; output is only shown on failure so
+        # parallel jobs do not interleave
+        subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
         )
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e.stdout}")
+        return False
+    except FileNotFoundError:
+        print(f"❌ {description} failed:")
+        print(f"Error: {command[0]} not found")
         return False
 
 
+def run_parallel(jobs):
+    """Run independent commands concurrently."""
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(run_command, cmd, desc) for cmd, desc in jobs]
+        return [future.result() for future in futures]
+
+
 def main():
     """Main development workflow."""
     print("🚀 Starting development workflow...")
@@ -27,24 +51,21 @@ def main():
     # Ensure we're in a git repository
     if not Path(".git").exists():
         print("Initializing git repository...")
-        run_command("git init", "Git initialization")
-        run_command("git add .", "Adding files to git")
+        run_command(["git", "init"], "Git initialization")
+        run_command(["git", "add", "."], "Adding files to git")
         run_command(
-            'git commit -m "Initial commit"', "Initial git commit"
+            ["git", "commit", "-m", "Initial commit"], "Initial git commit"
         )
     
     # Install/update pre-commit hooks
-    run_command("pre-commit install", "Installing pre-commit hooks")
-    
-    # Run code formatting
-    run_command("black src tests", "Code formatting with black")
-    run_command("isort src tests", "Import sorting with isort")
+    run_command(["pre-commit", "install"], "Installing pre-commit hooks")
     
-    # Run linting
-    run_command("flake8 src tests --max-line-length=88", "Linting")
+    # Run code formatting (sequential, both tools rewrite the same files)
+    run_command(["black", "src", "tests"], "Code formatting with black")
+    run_command(["isort", "src", "tests"], "Import sorting with isort")
     
-    # Run tests
-    run_command("pytest tests/ -v", "Running tests")
+    # Run linting and tests in parallel
+    run_parallel(CHECK_JOBS)
     
     print("\n🎉 Development setup complete!")
     print("You can now run: python -m src.main")
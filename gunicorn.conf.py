@@ -0,0 +1,6 @@
+"""Gunicorn configuration."""
+from src.config.settings import settings
+
+# Resolved and validated by Settings so every entry point agrees
+workers = settings.workers
+worker_class = "uvicorn.workers.UvicornWorker"
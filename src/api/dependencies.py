@@ -0,0 +1,29 @@
+"""Dependency providers for API routes."""
+from functools import lru_cache
+from typing import Optional
+
+import redis.asyncio as redis
+
+from src.config.settings import settings
+from src.monitoring.agents import HealthCheckAgent, SystemMonitoringAgent
+from src.monitoring.storage import RedisMetricsStore
+
+
+@lru_cache(maxsize=1)
+def get_metrics_store() -> Optional[RedisMetricsStore]:
+    """Get the shared metrics store, or None when Redis is disabled."""
+    if not settings.use_redis:
+        return None
+    return RedisMetricsStore(redis.from_url(settings.redis_url))
+
+
+@lru_cache(maxsize=1)
+def get_system_agent() -> SystemMonitoringAgent:
+    """Get the shared system monitoring agent."""
+    return SystemMonitoringAgent(store=get_metrics_store())
+
+
+@lru_cache(maxsize=1)
+def get_health_agent() -> HealthCheckAgent:
+    """Get the shared health check agent."""
+    return HealthCheckAgent(get_system_agent())
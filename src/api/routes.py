@@ -1,13 +1,21 @@
 """API routes for the monitoring system."""
-from fastapi import APIRouter, HTTPException
+import platform
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
+import psutil
+from fastapi import APIRouter, Depends, HTTPException, Response
+from redis.exceptions import RedisError
+
+from src.api.dependencies import (
+    get_health_agent,
+    get_metrics_store,
+    get_system_agent,
+)
 from src.monitoring.agents import HealthCheckAgent, SystemMonitoringAgent
+from src.monitoring.storage import SERIES_METRICS, RedisMetricsStore
 from src.utils.logger import logger
 
-# Global agent instances (in production, use dependency injection)
-system_agent = SystemMonitoringAgent()
-health_agent = HealthCheckAgent()
-
 router = APIRouter()
 
 
@@ -18,7 +26,7 @@ async def root():
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(health_agent: HealthCheckAgent = Depends(get_health_agent)):
     """Health check endpoint."""
     try:
         health_status = health_agent.get_health_status()
@@ -33,24 +41,49 @@ async def health_check():
 
 
 @router.get("/metrics")
-async def get_metrics():
+async def get_metrics(
+    system_agent: SystemMonitoringAgent = Depends(get_system_agent),
+    store: Optional[RedisMetricsStore] = Depends(get_metrics_store),
+):
     """Get current system metrics."""
     try:
-        metrics = system_agent.get_latest_metrics()
-        if not metrics:
+        # Prefer the shared store so every worker serves the same data, and
+        # fall back to this worker's local data while the store is unreachable
+        content = None
+        if store is not None:
+            try:
+                content = await store.get_latest_metrics_json()
+            except RedisError as e:
+                logger.warning("Metrics store unavailable", error=str(e))
+        if content is None:
+            content = system_agent.get_latest_metrics_json()
+        if not content:
             raise HTTPException(status_code=404, detail="No metrics available")
-        return metrics
+        return Response(content=content, media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Failed to get metrics", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics")
 
 
 @router.get("/metrics/history")
-async def get_metrics_history(limit: int = 50):
+async def get_metrics_history(
+    limit: int = 50,
+    system_agent: SystemMonitoringAgent = Depends(get_system_agent),
+    store: Optional[RedisMetricsStore] = Depends(get_metrics_store),
+):
     """Get historical metrics."""
     try:
-        history = system_agent.get_metrics_history(limit)
-        return {"count": len(history), "metrics": history}
+        content = None
+        if store is not None:
+            try:
+                content = await store.get_metrics_history_json(limit)
+            except RedisError as e:
+                logger.warning("Metrics store unavailable", error=str(e))
+        if content is None:
+            content = system_agent.get_metrics_history_json(limit)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         logger.error("Failed to get metrics history", error=str(e))
         raise HTTPException(
@@ -58,24 +91,49 @@ async def get_metrics_history(limit: int = 50):
         )
 
 
+@router.get("/metrics/history/{metric}")
+async def get_metric_series(
+    metric: str,
+    limit: int = 50,
+    system_agent: SystemMonitoringAgent = Depends(get_system_agent),
+    store: Optional[RedisMetricsStore] = Depends(get_metrics_store),
+):
+    """Get the history of a single numeric metric."""
+    if metric not in SERIES_METRICS:
+        raise HTTPException(status_code=404, detail=f"Unknown metric: {metric}")
+    try:
+        if store is not None:
+            try:
+                return await store.get_metric_series(metric, limit)
+            except RedisError as e:
+                logger.warning("Metrics store unavailable", error=str(e))
+        return system_agent.get_metric_series(metric, limit)
+    except Exception as e:
+        logger.error("Failed to get metric series", metric=metric, error=str(e))
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve metric series"
+        )
+
+
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
+    """Collect system information that does not change while the process runs."""
+    return {
+        "platform": platform.platform(),
+        "architecture": platform.architecture(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+        "boot_time": psutil.boot_time(),
+        "cpu_count": psutil.cpu_count(),
+        "memory_total": psutil.virtual_memory().total,
+    }
+
+
 @router.get("/system/info")
 async def get_system_info():
     """Get basic system information."""
     try:
-        import platform
-
-        import psutil
-
-        boot_time = psutil.boot_time()
-        return {
-            "platform": platform.platform(),
-            "architecture": platform.architecture(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-            "boot_time": boot_time,
-            "cpu_count": psutil.cpu_count(),
-            "memory_total": psutil.virtual_memory().total,
-        }
+        return _static_system_info()
     except Exception as e:
         logger.error("Failed to get system info", error=str(e))
         raise HTTPException(
@@ -17,20 +17,27 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(env="DATABASE_URL")
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
+    use_redis: bool = Field(default=False, env="USE_REDIS")
 
     # Monitoring
     collection_interval: int = Field(default=30, env="COLLECTION_INTERVAL")
     alert_threshold_cpu: float = Field(default=80.0, env="ALERT_THRESHOLD_CPU")
     alert_threshold_memory: float = Field(default=85.0, env="ALERT_THRESHOLD_MEMORY")
     alert_threshold_disk: float = Field(default=90.0, env="ALERT_THRESHOLD_DISK")
+    # Collectors log one in every N collections
+    log_sample_rate: int = Field(default=10, ge=1, env="LOG_SAMPLE_RATE")
 
     # API
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
     api_port: int = Field(default=8000, env="API_PORT")
+    # More than one worker needs USE_REDIS=true to share the metrics history
+    workers: int = Field(default=1, ge=1, env="WORKERS")
 
     class Config:
         env_file = ".env"
         case_sensitive = False
+        # Settings are resolved once at import and shared read-only
+        frozen = True
 
 
 settings = Settings()
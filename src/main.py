@@ -4,9 +4,11 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
-from src.api.routes import health_agent, router, system_agent
+from src.api.dependencies import get_health_agent, get_metrics_store, get_system_agent
+from src.api.routes import router
 from src.config.settings import settings
 from src.utils.logger import logger
 
@@ -19,6 +21,14 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Starting monitoring system", version=settings.app_version)
+    if settings.workers > 1 and not settings.use_redis:
+        logger.warning(
+            "Running multiple workers without USE_REDIS, "
+            "each worker serves its own metrics history",
+            workers=settings.workers,
+        )
+    system_agent = get_system_agent()
+    health_agent = get_health_agent()
 
     # Start monitoring agents
     monitoring_tasks.extend(
@@ -47,6 +57,11 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    # Close the shared store connection pool
+    store = get_metrics_store()
+    if store is not None:
+        await store.client.aclose()
+
     logger.info("Monitoring system stopped")
 
 
@@ -59,8 +74,12 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Compress larger responses such as /metrics/history
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Add root redirect
     @app.get("/")
     async def root():
@@ -83,4 +102,5 @@ if __name__ == "__main__":
         port=settings.api_port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        workers=settings.workers,
     )
@@ -2,10 +2,19 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import orjson
+from redis.exceptions import RedisError
 
 from src.config.settings import settings
-from src.monitoring.collectors import ProcessCollector, SystemCollector
+from src.monitoring.collectors import ProcessCollector, SystemCollector, SystemMetrics
+from src.monitoring.storage import (
+    SERIES_METRICS,
+    RedisMetricsStore,
+    build_metric_series,
+)
 from src.utils.logger import logger
 
 
@@ -27,6 +36,10 @@ class BaseAgent(ABC):
         """Process collected data."""
         pass
 
+    async def should_collect(self) -> bool:
+        """Check whether this agent should collect on the current cycle."""
+        return True
+
     async def run(self) -> None:
         """Main agent loop."""
         self.running = True
@@ -34,8 +47,9 @@ class BaseAgent(ABC):
 
         while self.running:
             try:
-                data = await self.collect_data()
-                await self.process_data(data)
+                if await self.should_collect():
+                    data = await self.collect_data()
+                    await self.process_data(data)
                 await asyncio.sleep(settings.collection_interval)
             except Exception as e:
                 self.logger.error(f"Error in {self.name} agent", error=str(e))
@@ -50,16 +64,42 @@ class BaseAgent(ABC):
 class SystemMonitoringAgent(BaseAgent):
     """Agent for monitoring system metrics."""
 
-    def __init__(self):
+    def __init__(self, store: Optional[RedisMetricsStore] = None):
         super().__init__("SystemMonitoring")
         self.system_collector = SystemCollector()
         self.process_collector = ProcessCollector()
-        self.metrics_history: List[Dict[str, Any]] = []
+        # Bounded to the last 100 entries, oldest are evicted on append
+        self.metrics_history: Deque[Dict[str, Any]] = deque(maxlen=100)
+        # Column-oriented copy of the numeric metrics for time-series queries
+        self._columns: Dict[str, Deque[float]] = {
+            name: deque(maxlen=100) for name in ("timestamp",) + SERIES_METRICS
+        }
+        # Shared store for multi-worker deployments, None keeps data local
+        self.store = store
+        # Serialized responses, rebuilt at most once per collection
+        self._latest_json: Optional[bytes] = None
+        self._history_json: Dict[int, bytes] = {}
+
+    async def should_collect(self) -> bool:
+        """Collect only on the worker elected to publish to the shared store."""
+        if self.store is None:
+            return True
+        try:
+            return await self.store.claim_writer(
+                ttl=max(settings.collection_interval * 2, 10)
+            )
+        except RedisError as e:
+            # Keep collecting locally while the shared store is unreachable
+            self.logger.warning("Failed to claim metrics writer role", error=str(e))
+            return True
 
     async def collect_data(self) -> Dict[str, Any]:
         """Collect system and process data."""
-        system_metrics = self.system_collector.collect_metrics()
-        top_processes = self.process_collector.collect_top_processes()
+        # psutil calls are blocking, run both collectors in worker threads
+        system_metrics, top_processes = await asyncio.gather(
+            asyncio.to_thread(self.system_collector.collect_metrics),
+            asyncio.to_thread(self.process_collector.collect_top_processes),
+        )
 
         return {
             "system_metrics": system_metrics,
@@ -69,16 +109,23 @@ class SystemMonitoringAgent(BaseAgent):
 
     async def process_data(self, data: Dict[str, Any]) -> None:
         """Process and store collected data."""
-        # Store in memory for now (Phase 1)
         self.metrics_history.append(data)
-
-        # Keep only last 100 entries
-        if len(self.metrics_history) > 100:
-            self.metrics_history.pop(0)
+        self._columns["timestamp"].append(data["timestamp"])
+        for name in SERIES_METRICS:
+            self._columns[name].append(getattr(data["system_metrics"], name))
+        self._latest_json = None
+        self._history_json.clear()
 
         # Check for alerts
         await self._check_alerts(data["system_metrics"])
 
+        # Publish to the shared store; only the elected writer collects
+        if self.store is not None:
+            try:
+                await self.store.push(data)
+            except RedisError as e:
+                self.logger.warning("Failed to publish metrics", error=str(e))
+
     async def _check_alerts(self, metrics) -> None:
         """Check if any metrics exceed thresholds."""
         alerts = []
@@ -102,14 +149,44 @@ class SystemMonitoringAgent(BaseAgent):
 
     def get_metrics_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get historical metrics."""
-        return self.metrics_history[-limit:]
+        return list(self.metrics_history)[-limit:]
+
+    def get_metric_series(self, metric: str, limit: int = 50) -> Dict[str, Any]:
+        """Get the recent values of a single metric with their timestamps."""
+        return build_metric_series(
+            metric,
+            list(self._columns["timestamp"])[-limit:],
+            list(self._columns[metric])[-limit:],
+        )
+
+    def get_latest_metrics_json(self) -> bytes:
+        """Get the latest collected metrics serialized as JSON."""
+        if not self.metrics_history:
+            return b""
+        if self._latest_json is None:
+            self._latest_json = orjson.dumps(self.metrics_history[-1])
+        return self._latest_json
+
+    def get_metrics_history_json(self, limit: int = 50) -> bytes:
+        """Get historical metrics serialized as a JSON response body."""
+        history = self.get_metrics_history(limit)
+        # Every limit selects a suffix of the history, so its length is the key
+        cached = self._history_json.get(len(history))
+        if cached is None:
+            cached = orjson.dumps({"count": len(history), "metrics": history})
+            self._history_json[len(history)] = cached
+        return cached
 
 
 class HealthCheckAgent(BaseAgent):
     """Agent for performing health checks."""
 
-    def __init__(self):
+    # Seconds between checks for the first system sample at startup
+    FIRST_SAMPLE_POLL_INTERVAL = 0.5
+
+    def __init__(self, system_agent: SystemMonitoringAgent):
         super().__init__("HealthCheck")
+        self.system_agent = system_agent
         self.health_status = {}
 
     async def collect_data(self) -> Dict[str, Any]:
@@ -129,26 +206,64 @@ class HealthCheckAgent(BaseAgent):
         failed_checks = [
             check
             for check, status in data["system_health"].items()
-            if not status["healthy"]
+            if status["healthy"] is False
+        ]
+        unknown_checks = [
+            check
+            for check, status in data["system_health"].items()
+            if status["healthy"] is None
         ]
 
         if failed_checks:
             self.logger.warning("Health checks failed", failed_checks=failed_checks)
+        elif unknown_checks:
+            self.logger.info("Health checks pending", unknown_checks=unknown_checks)
         else:
             self.logger.info("All health checks passed")
 
+    async def run(self) -> None:
+        """Wait for the first system sample, then run the health check loop."""
+        await self._wait_for_first_sample()
+        await super().run()
+
+    async def _wait_for_first_sample(self) -> None:
+        """Wait up to one collection interval for a system sample to exist."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.collection_interval
+        while await self._latest_system_metrics() is None and loop.time() < deadline:
+            await asyncio.sleep(self.FIRST_SAMPLE_POLL_INTERVAL)
+
+    async def _latest_system_metrics(self) -> Optional[SystemMetrics]:
+        """Get the latest system sample without collecting a new one."""
+        # With a shared store every worker reads the sample published by the
+        # metrics writer, falling back to local data if the store is unreachable
+        if self.system_agent.store is not None:
+            try:
+                metrics = await self.system_agent.store.get_latest_system_metrics()
+                if metrics is not None:
+                    return metrics
+            except RedisError as e:
+                self.logger.warning("Failed to read shared metrics", error=str(e))
+        return self.system_agent.get_latest_metrics().get("system_metrics")
+
     async def _check_system_health(self) -> Dict[str, Any]:
         """Check system health indicators."""
+        # Before the first sample exists the checks are reported as unknown (None)
+        metrics = await self._latest_system_metrics()
+        disk_healthy = memory_healthy = None
+        if metrics is not None:
+            disk_healthy = all(
+                usage["percent"] < 95 for usage in metrics.disk_usage.values()
+            )
+            memory_healthy = metrics.memory_percent < 95
+
         return {
             "disk_space": {
-                "healthy": all(
-                    usage["percent"] < 95
-                    for usage in SystemCollector().collect_metrics().disk_usage.values()
-                ),
+                "healthy": disk_healthy,
                 "description": "Disk space availability",
             },
             "memory": {
-                "healthy": SystemCollector().collect_metrics().memory_percent < 95,
+                "healthy": memory_healthy,
                 "description": "Memory availability",
             },
         }
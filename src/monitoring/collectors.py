@@ -1,11 +1,14 @@
 """Data collectors for system metrics."""
 
+import heapq
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 
 import psutil
 
+from src.config.settings import settings
 from src.utils.logger import logger
 
 
@@ -16,7 +19,7 @@ class SystemMetrics:
     timestamp: float
     cpu_percent: float
     memory_percent: float
-    disk_usage: Dict[str, float]
+    disk_usage: Dict[str, Dict[str, float]]
     network_io: Dict[str, int]
     process_count: int
     load_average: List[float]
@@ -25,14 +28,23 @@ class SystemMetrics:
 class SystemCollector:
     """Collects system-level metrics."""
 
+    # Mounted partitions rarely change, so they are only re-read periodically
+    PARTITIONS_REFRESH_SECONDS = 300
+
     def __init__(self):
         self.logger = logger.bind(component="SystemCollector")
+        self._log_every = settings.log_sample_rate
+        self._tick = 0
+        self._partitions_cache: List[Any] = []
+        self._partitions_ts: Optional[float] = None
+        # Prime psutil's CPU counter so the first non-blocking read is meaningful
+        psutil.cpu_percent(interval=None)
 
     def collect_metrics(self) -> SystemMetrics:
         """Collect current system metrics."""
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU metrics (delta since the previous call, does not block)
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Memory metrics
             memory = psutil.virtual_memory()
@@ -40,14 +52,14 @@ class SystemCollector:
 
             # Disk metrics
             disk_usage = {}
-            for partition in psutil.disk_partitions():
+            for partition in self._get_partitions():
                 try:
                     partition_usage = psutil.disk_usage(partition.mountpoint)
                     disk_usage[partition.mountpoint] = {
                         "total": partition_usage.total,
                         "used": partition_usage.used,
                         "free": partition_usage.free,
-                        "percent": (partition_usage.used / partition_usage.total) * 100,
+                        "percent": partition_usage.percent,
                     }
                 except PermissionError:
                     continue
@@ -74,12 +86,15 @@ class SystemCollector:
                 load_average=load_average,
             )
 
-            self.logger.info(
-                "System metrics collected",
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                process_count=process_count,
-            )
+            # Only log a sample of collections to keep I/O off the hot path
+            self._tick += 1
+            if self._tick % self._log_every == 0:
+                self.logger.info(
+                    "System metrics collected",
+                    cpu_percent=cpu_percent,
+                    memory_percent=memory_percent,
+                    process_count=process_count,
+                )
 
             return metrics
 
@@ -87,33 +102,91 @@ class SystemCollector:
             self.logger.error("Failed to collect system metrics", error=str(e))
             raise
 
+    def _get_partitions(self) -> List[Any]:
+        """Get mounted disk partitions, refreshing the cached list when stale."""
+        now = time.monotonic()
+        if (
+            self._partitions_ts is None
+            or now - self._partitions_ts > self.PARTITIONS_REFRESH_SECONDS
+        ):
+            self._partitions_cache = psutil.disk_partitions(all=False)
+            self._partitions_ts = now
+        return self._partitions_cache
+
 
 class ProcessCollector:
     """Collects process-level metrics."""
 
+    # Seconds between the priming sample and the first real reading
+    PRIME_INTERVAL = 0.1
+
     def __init__(self):
         self.logger = logger.bind(component="ProcessCollector")
+        self._log_every = settings.log_sample_rate
+        self._tick = 0
+        self._primed = False
+        # Process objects kept between collections so cpu_percent measures
+        # usage since the previous collection
+        self._procs: Dict[int, psutil.Process] = {}
+
+    def _refresh_processes(self) -> None:
+        """Drop exited processes and start tracking new ones."""
+        current = set(psutil.pids())
+        # is_running() compares creation times, so a pid reused by a new
+        # process drops its stale Process object and is tracked afresh below
+        self._procs = {
+            pid: proc
+            for pid, proc in self._procs.items()
+            if pid in current and proc.is_running()
+        }
+        for pid in current.difference(self._procs):
+            try:
+                self._procs[pid] = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+    def _prime(self) -> None:
+        """Take an initial CPU sample so later readings return real deltas."""
+        for proc in self._procs.values():
+            try:
+                proc.cpu_percent(None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        time.sleep(self.PRIME_INTERVAL)
+        self._primed = True
 
     def collect_top_processes(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Collect top processes by CPU usage."""
         try:
+            self._refresh_processes()
+            if not self._primed:
+                self._prime()
+
             processes = []
-            for proc in psutil.process_iter(
-                ["pid", "name", "cpu_percent", "memory_percent"]
-            ):
+            for pid, proc in list(self._procs.items()):
                 try:
-                    proc_info = proc.info
-                    proc_info["cpu_percent"] = proc.cpu_percent()
-                    processes.append(proc_info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    with proc.oneshot():
+                        processes.append(
+                            {
+                                "pid": pid,
+                                "name": proc.name(),
+                                "cpu_percent": proc.cpu_percent(None),
+                                "memory_percent": proc.memory_percent(),
+                            }
+                        )
+                except psutil.NoSuchProcess:
+                    del self._procs[pid]
+                except psutil.AccessDenied:
                     continue
 
-            # Sort by CPU usage and return top processes
-            top_processes = sorted(
-                processes, key=lambda x: x["cpu_percent"], reverse=True
-            )[:limit]
+            # Select top processes by CPU usage without sorting the full list
+            top_processes = heapq.nlargest(
+                limit, processes, key=itemgetter("cpu_percent")
+            )
 
-            self.logger.info(f"Collected top {len(top_processes)} processes")
+            self._tick += 1
+            if self._tick % self._log_every == 0:
+                self.logger.info(f"Collected top {len(top_processes)} processes")
             return top_processes
 
         except Exception as e:
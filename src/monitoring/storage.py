@@ -0,0 +1,103 @@
+"""Shared storage for collected metrics."""
+
+import os
+import socket
+from typing import Any, Dict, List, Optional, Sequence
+
+import orjson
+import redis.asyncio as redis
+
+from src.monitoring.collectors import SystemMetrics
+from src.utils.logger import logger
+
+# Numeric SystemMetrics fields also stored as per-column time series
+SERIES_METRICS = ("cpu_percent", "memory_percent", "process_count")
+
+# Extend the writer lease only if this worker still holds it
+RENEW_WRITER_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("EXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def build_metric_series(
+    metric: str, timestamps: Sequence[float], values: Sequence[float]
+) -> Dict[str, Any]:
+    """Build the response body for a single metric time series."""
+    return {"metric": metric, "timestamps": list(timestamps), "values": list(values)}
+
+
+class RedisMetricsStore:
+    """Metrics history shared between worker processes through Redis."""
+
+    HISTORY_KEY = "metrics:history"
+    WRITER_KEY = "metrics:writer"
+    SERIES_KEY = "metrics:series:{}"
+
+    def __init__(self, client: redis.Redis, max_entries: int = 100):
+        self.client = client
+        self.max_entries = max_entries
+        # Identifies this worker when electing the single metrics writer
+        self.token = f"{socket.gethostname()}:{os.getpid()}".encode()
+        self.logger = logger.bind(component="RedisMetricsStore")
+
+    async def claim_writer(self, ttl: int) -> bool:
+        """Claim or renew the right to publish metrics for ttl seconds."""
+        if await self.client.set(self.WRITER_KEY, self.token, nx=True, ex=ttl):
+            self.logger.info("Acquired metrics writer role")
+            return True
+
+        # Compare and extend in one step so an expired lease taken over by
+        # another worker is never extended by the previous holder
+        renewed = await self.client.eval(
+            RENEW_WRITER_SCRIPT, 1, self.WRITER_KEY, self.token, ttl
+        )
+        return bool(renewed)
+
+    async def push(self, data: Dict[str, Any]) -> None:
+        """Prepend an entry and trim the history to max_entries."""
+        columns = {"timestamp": data["timestamp"]}
+        for name in SERIES_METRICS:
+            columns[name] = getattr(data["system_metrics"], name)
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.lpush(self.HISTORY_KEY, orjson.dumps(data))
+            pipe.ltrim(self.HISTORY_KEY, 0, self.max_entries - 1)
+            for name, value in columns.items():
+                key = self.SERIES_KEY.format(name)
+                pipe.lpush(key, orjson.dumps(value))
+                pipe.ltrim(key, 0, self.max_entries - 1)
+            await pipe.execute()
+
+    async def get_latest_metrics_json(self) -> bytes:
+        """Get the most recent entry as stored JSON."""
+        return await self.client.lindex(self.HISTORY_KEY, 0) or b""
+
+    async def get_latest_system_metrics(self) -> Optional[SystemMetrics]:
+        """Get the system metrics of the most recent entry."""
+        raw = await self.client.lindex(self.HISTORY_KEY, 0)
+        if not raw:
+            return None
+        return SystemMetrics(**orjson.loads(raw)["system_metrics"])
+
+    async def get_metrics_history_json(self, limit: int = 50) -> bytes:
+        """Get up to limit recent entries, oldest first, as a JSON response body."""
+        raw = await self.client.lrange(self.HISTORY_KEY, 0, limit - 1)
+        return b'{"count":%d,"metrics":[%s]}' % (len(raw), b",".join(reversed(raw)))
+
+    async def get_metric_series(self, metric: str, limit: int = 50) -> Dict[str, Any]:
+        """Get the recent values of a single metric with their timestamps."""
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.lrange(self.SERIES_KEY.format("timestamp"), 0, limit - 1)
+            pipe.lrange(self.SERIES_KEY.format(metric), 0, limit - 1)
+            timestamps, values = await pipe.execute()
+        return build_metric_series(
+            metric, _load_column(timestamps), _load_column(values)
+        )
+
+
+def _load_column(raw: List[bytes]) -> List[Any]:
+    """Decode a newest-first Redis column into an oldest-first list."""
+    return orjson.loads(b"[%s]" % b",".join(reversed(raw)))
@@ -1,23 +1,25 @@
 """Tests for monitoring agents."""
 
 import asyncio
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from src.monitoring.agents import HealthCheckAgent, SystemMonitoringAgent
 
 
 @pytest.fixture
 def system_agent():
-    """Create a SystemMonitoringAgent instance."""
-    return SystemMonitoringAgent()
+    """Create a SystemMonitoringAgent instance without a shared store."""
+    return SystemMonitoringAgent(store=None)
 
 
 @pytest.fixture
-def health_agent():
+def health_agent(system_agent):
     """Create a HealthCheckAgent instance."""
-    return HealthCheckAgent()
+    return HealthCheckAgent(system_agent)
 
 
 class TestSystemMonitoringAgent:
@@ -42,16 +44,67 @@ class TestSystemMonitoringAgent:
                 assert "timestamp" in data
 
     @pytest.mark.asyncio
-    async def test_process_data(self, system_agent):
+    async def test_process_data(self, system_agent, make_data):
         """Test data processing."""
-        test_data = {
-            "system_metrics": Mock(
-                cpu_percent=50.0, memory_percent=60.0, disk_usage={}
-            ),
-            "timestamp": 12345.0,
-        }
+        await system_agent.process_data(make_data(12345.0))
+        assert len(system_agent.metrics_history) == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_history_is_bounded(self, system_agent, make_data):
+        """Test that only the most recent entries are kept."""
+        for i in range(105):
+            await system_agent.process_data(make_data(float(i)))
+
+        assert len(system_agent.metrics_history) == 100
+        history = system_agent.get_metrics_history(limit=3)
+        assert [entry["timestamp"] for entry in history] == [102.0, 103.0, 104.0]
+
+    @pytest.mark.asyncio
+    async def test_metrics_json_refreshed_on_new_data(self, system_agent, make_data):
+        """Test that serialized metrics are cached until new data arrives."""
+        await system_agent.process_data(make_data(1.0))
+        first = system_agent.get_metrics_history_json(limit=10)
+        assert system_agent.get_metrics_history_json(limit=10) is first
+
+        await system_agent.process_data(make_data(2.0))
 
-        await system_agent.process_data(test_data)
+        latest = json.loads(system_agent.get_latest_metrics_json())
+        assert latest["timestamp"] == 2.0
+        history = json.loads(system_agent.get_metrics_history_json(limit=10))
+        assert history["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_metric_series(self, system_agent, make_data):
+        """Test getting the history of a single metric."""
+        for i in range(3):
+            await system_agent.process_data(make_data(float(i), cpu_percent=i))
+
+        series = system_agent.get_metric_series("cpu_percent", limit=2)
+        assert series["timestamps"] == [1.0, 2.0]
+        assert series["values"] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_should_collect_only_as_writer(self, system_agent):
+        """Test that workers not elected as writer skip collection."""
+        system_agent.store = Mock(claim_writer=AsyncMock(return_value=False))
+        assert await system_agent.should_collect() is False
+
+        system_agent.store.claim_writer.return_value = True
+        assert await system_agent.should_collect() is True
+
+    @pytest.mark.asyncio
+    async def test_store_errors_do_not_interrupt_collection(
+        self, system_agent, make_data
+    ):
+        """Test that an unreachable store falls back to local collection."""
+        error = RedisConnectionError("down")
+        system_agent.store = Mock(
+            claim_writer=AsyncMock(side_effect=error),
+            push=AsyncMock(side_effect=error),
+        )
+
+        assert await system_agent.should_collect() is True
+        await system_agent.process_data(make_data(1.0))
         assert len(system_agent.metrics_history) == 1
 
     def test_get_latest_metrics(self, system_agent):
@@ -73,6 +126,59 @@ class TestHealthCheckAgent:
         assert "service_health" in data
         assert "timestamp" in data
 
+    @pytest.mark.asyncio
+    async def test_system_health_uses_latest_metrics(self, health_agent, make_data):
+        """Test that health checks reuse the monitoring agent's latest sample."""
+        health_agent.system_agent.metrics_history.append(
+            make_data(12345.0, memory_percent=97.0)
+        )
+
+        with patch.object(
+            health_agent.system_agent.system_collector, "collect_metrics"
+        ) as mock_collect:
+            health = await health_agent._check_system_health()
+
+        mock_collect.assert_not_called()
+        assert health["disk_space"]["healthy"] is True
+        assert health["memory"]["healthy"] is False
+
+    @pytest.mark.asyncio
+    async def test_system_health_uses_shared_sample(self, health_agent, make_data):
+        """Test that health checks read the writer's sample from the store."""
+        shared = make_data(1.0)["system_metrics"]
+        health_agent.system_agent.store = Mock(
+            get_latest_system_metrics=AsyncMock(return_value=shared)
+        )
+
+        health = await health_agent._check_system_health()
+
+        assert health["disk_space"]["healthy"] is True
+        assert health["memory"]["healthy"] is True
+
+    @pytest.mark.asyncio
+    async def test_system_health_unknown_without_sample(self, health_agent):
+        """Test that health checks do not collect when no sample exists yet."""
+        with patch.object(
+            health_agent.system_agent.system_collector, "collect_metrics"
+        ) as mock_collect:
+            health = await health_agent._check_system_health()
+
+        mock_collect.assert_not_called()
+        assert health["disk_space"]["healthy"] is None
+        assert health["memory"]["healthy"] is None
+
+    @pytest.mark.asyncio
+    async def test_waits_for_first_sample(self, health_agent, make_data):
+        """Test that the first health cycle waits for a system sample."""
+        health_agent.FIRST_SAMPLE_POLL_INTERVAL = 0.01
+        waiter = asyncio.create_task(health_agent._wait_for_first_sample())
+
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        health_agent.system_agent.metrics_history.append(make_data(1.0))
+        await asyncio.wait_for(waiter, timeout=1)
+
     @pytest.mark.asyncio
     async def test_process_data(self, health_agent):
         """Test health check data processing."""
@@ -1,17 +1,26 @@
 """Tests for API routes."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
 
+from src.api.dependencies import get_health_agent, get_metrics_store, get_system_agent
 from src.main import create_app
 
 
 @pytest.fixture
-def client():
-    """Create test client."""
+def app():
+    """Create application without a shared metrics store."""
     app = create_app()
+    app.dependency_overrides[get_metrics_store] = lambda: None
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client."""
     return TestClient(app)
 
 
@@ -22,27 +31,29 @@ def test_root_endpoint(client):
     assert "message" in response.json()
 
 
-def test_health_endpoint(client):
+def test_health_endpoint(app, client):
     """Test health check endpoint."""
-    with patch("src.api.routes.health_agent") as mock_agent:
-        mock_agent.get_health_status.return_value = {
-            "timestamp": 12345.0,
-            "system_health": {"test": {"healthy": True}},
-        }
+    mock_agent = Mock()
+    mock_agent.get_health_status.return_value = {
+        "timestamp": 12345.0,
+        "system_health": {"test": {"healthy": True}},
+    }
+    app.dependency_overrides[get_health_agent] = lambda: mock_agent
 
-        response = client.get("/api/v1/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "healthy"
+    response = client.get("/api/v1/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
 
 
-def test_metrics_endpoint(client):
+def test_metrics_endpoint(app, client):
     """Test metrics endpoint."""
-    with patch("src.api.routes.system_agent") as mock_agent:
-        mock_agent.get_latest_metrics.return_value = {"cpu_percent": 50.0}
+    mock_agent = Mock()
+    mock_agent.get_latest_metrics_json.return_value = b'{"cpu_percent": 50.0}'
+    app.dependency_overrides[get_system_agent] = lambda: mock_agent
 
-        response = client.get("/api/v1/metrics")
-        assert response.status_code == 200
-        assert "cpu_percent" in response.json()
+    response = client.get("/api/v1/metrics")
+    assert response.status_code == 200
+    assert "cpu_percent" in response.json()
 
 
 def test_system_info_endpoint(client):
@@ -50,3 +61,50 @@ def test_system_info_endpoint(client):
     response = client.get("/api/v1/system/info")
     assert response.status_code == 200
     assert "platform" in response.json()
+
+
+def test_metric_series_unknown_metric(client):
+    """Test that unknown metric names are rejected."""
+    response = client.get("/api/v1/metrics/history/unknown")
+    assert response.status_code == 404
+
+
+def test_metrics_fall_back_to_local_data(app, client):
+    """Test that metrics routes serve local data when the store is unreachable."""
+    error = RedisConnectionError("down")
+    store = Mock(
+        get_latest_metrics_json=AsyncMock(side_effect=error),
+        get_metrics_history_json=AsyncMock(side_effect=error),
+        get_metric_series=AsyncMock(side_effect=error),
+    )
+    mock_agent = Mock()
+    mock_agent.get_latest_metrics_json.return_value = b'{"cpu_percent": 50.0}'
+    mock_agent.get_metrics_history_json.return_value = b'{"count": 0, "metrics": []}'
+    mock_agent.get_metric_series.return_value = {"metric": "cpu_percent"}
+    app.dependency_overrides[get_metrics_store] = lambda: store
+    app.dependency_overrides[get_system_agent] = lambda: mock_agent
+
+    assert client.get("/api/v1/metrics").json() == {"cpu_percent": 50.0}
+    assert client.get("/api/v1/metrics/history").json()["count"] == 0
+    response = client.get("/api/v1/metrics/history/cpu_percent")
+    assert response.json() == {"metric": "cpu_percent"}
+
+
+def test_metrics_endpoint_without_data(app, client):
+    """Test that the metrics endpoint reports missing data as not found."""
+    mock_agent = Mock()
+    mock_agent.get_latest_metrics_json.return_value = b""
+    app.dependency_overrides[get_system_agent] = lambda: mock_agent
+
+    response = client.get("/api/v1/metrics")
+    assert response.status_code == 404
+
+
+def test_shutdown_closes_store_client(app):
+    """Test that the metrics store connection is closed on shutdown."""
+    store = Mock(client=Mock(aclose=AsyncMock()))
+    with patch("src.main.get_metrics_store", return_value=store):
+        with TestClient(app):
+            pass
+
+    store.client.aclose.assert_awaited_once()
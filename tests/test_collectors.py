@@ -0,0 +1,77 @@
+"""Tests for metric collectors."""
+
+from unittest.mock import MagicMock, patch
+
+import psutil
+import pytest
+
+from src.monitoring.collectors import ProcessCollector
+
+
+def make_process(pid, readings):
+    """Create a fake psutil.Process returning the given CPU readings."""
+    proc = MagicMock()
+    proc.pid = pid
+    proc.cpu_percent.side_effect = readings
+    proc.name.return_value = f"proc-{pid}"
+    proc.memory_percent.return_value = 1.0
+    return proc
+
+
+@pytest.fixture
+def processes():
+    """Fake processes; the first reading of each is the priming sample."""
+    return {
+        1: make_process(1, [0.0, 5.0, 7.0]),
+        2: make_process(2, [0.0, 50.0, 1.0]),
+        3: make_process(3, [0.0, 20.0, 30.0]),
+    }
+
+
+@pytest.fixture
+def patched_psutil(processes):
+    """Patch psutil process discovery to return the fake processes."""
+    with patch("psutil.pids", side_effect=lambda: list(processes)), patch(
+        "psutil.Process", side_effect=lambda pid: processes[pid]
+    ), patch("src.monitoring.collectors.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+class TestProcessCollector:
+    """Test ProcessCollector."""
+
+    def test_primes_once_and_ranks_by_later_readings(self, patched_psutil):
+        """Test that priming happens once and later readings rank processes."""
+        collector = ProcessCollector()
+
+        first = collector.collect_top_processes(limit=2)
+        second = collector.collect_top_processes(limit=2)
+
+        patched_psutil.assert_called_once_with(ProcessCollector.PRIME_INTERVAL)
+        assert [(p["pid"], p["cpu_percent"]) for p in first] == [(2, 50.0), (3, 20.0)]
+        assert [(p["pid"], p["cpu_percent"]) for p in second] == [(3, 30.0), (1, 7.0)]
+
+    def test_exited_process_is_dropped(self, processes, patched_psutil):
+        """Test that a process raising NoSuchProcess is removed from the map."""
+        collector = ProcessCollector()
+        processes[2].name.side_effect = psutil.NoSuchProcess(2)
+
+        top = collector.collect_top_processes(limit=3)
+
+        assert 2 not in collector._procs
+        assert [p["pid"] for p in top] == [3, 1]
+
+    def test_reused_pid_gets_new_process(self, processes, patched_psutil):
+        """Test that a pid reused by a new process is not read from the old one."""
+        collector = ProcessCollector()
+        collector.collect_top_processes()
+
+        old = processes[1]
+        old.is_running.return_value = False
+        processes[1] = make_process(1, [0.0])
+
+        collector.collect_top_processes()
+
+        assert collector._procs[1] is processes[1]
+        # Priming and the first reading only
+        assert old.cpu_percent.call_count == 2
@@ -0,0 +1,106 @@
+"""Tests for the shared metrics store."""
+
+import json
+
+import fakeredis
+import pytest
+
+from src.monitoring.collectors import SystemMetrics
+from src.monitoring.storage import RedisMetricsStore
+
+
+@pytest.fixture
+def client():
+    """Create an in-memory Redis client with its own server."""
+    return fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+
+
+@pytest.fixture
+def store(client):
+    """Create a RedisMetricsStore with a small history."""
+    return RedisMetricsStore(client, max_entries=3)
+
+
+class TestRedisMetricsStore:
+    """Test RedisMetricsStore."""
+
+    @pytest.mark.asyncio
+    async def test_history_is_trimmed_and_oldest_first(self, store, make_data):
+        """Test that pushes are trimmed to max_entries and read oldest first."""
+        for i in range(5):
+            await store.push(make_data(float(i)))
+
+        history = json.loads(await store.get_metrics_history_json(limit=10))
+        assert history["count"] == 3
+        assert [entry["timestamp"] for entry in history["metrics"]] == [
+            2.0,
+            3.0,
+            4.0,
+        ]
+
+        history = json.loads(await store.get_metrics_history_json(limit=2))
+        assert [entry["timestamp"] for entry in history["metrics"]] == [3.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_empty_history(self, store):
+        """Test reading from an empty store."""
+        assert await store.get_latest_metrics_json() == b""
+        assert await store.get_latest_system_metrics() is None
+        history = json.loads(await store.get_metrics_history_json())
+        assert history == {"count": 0, "metrics": []}
+
+    @pytest.mark.asyncio
+    async def test_latest_metrics(self, store, make_data):
+        """Test reading the most recent entry."""
+        await store.push(make_data(1.0))
+        await store.push(make_data(2.0, cpu_percent=75.0))
+
+        latest = json.loads(await store.get_latest_metrics_json())
+        assert latest["timestamp"] == 2.0
+
+        metrics = await store.get_latest_system_metrics()
+        assert isinstance(metrics, SystemMetrics)
+        assert metrics.cpu_percent == 75.0
+
+    @pytest.mark.asyncio
+    async def test_get_metric_series(self, store, make_data):
+        """Test reading a single metric column oldest first."""
+        for i in range(4):
+            await store.push(make_data(float(i), cpu_percent=float(i * 10)))
+
+        series = await store.get_metric_series("cpu_percent", limit=2)
+        assert series == {
+            "metric": "cpu_percent",
+            "timestamps": [2.0, 3.0],
+            "values": [20.0, 30.0],
+        }
+
+        # Columns are trimmed with the history and keep their types
+        series = await store.get_metric_series("process_count", limit=10)
+        assert series["timestamps"] == [1.0, 2.0, 3.0]
+        assert series["values"] == [10, 10, 10]
+
+    @pytest.mark.asyncio
+    async def test_writer_election_excludes_other_workers(self, client, store):
+        """Test that only one token holds the writer role at a time."""
+        other = RedisMetricsStore(client)
+        other.token = b"other-worker"
+
+        assert await store.claim_writer(ttl=30) is True
+        assert await other.claim_writer(ttl=30) is False
+        # The current writer renews its lease
+        assert await store.claim_writer(ttl=30) is True
+        assert await other.claim_writer(ttl=30) is False
+
+    @pytest.mark.asyncio
+    async def test_writer_role_taken_over_after_expiry(self, client, store):
+        """Test that a lapsed lease is not renewed by its previous holder."""
+        other = RedisMetricsStore(client)
+        other.token = b"other-worker"
+
+        assert await store.claim_writer(ttl=30) is True
+        await client.delete(RedisMetricsStore.WRITER_KEY)
+        assert await other.claim_writer(ttl=30) is True
+
+        assert await store.claim_writer(ttl=30) is False
+        assert await client.get(RedisMetricsStore.WRITER_KEY) == b"other-worker"